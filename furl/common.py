@@ -21,4 +21,4 @@ def callable_attr(obj, attr):
 
 
 def is_iterable_but_not_string(v):
-    return callable_attr(v, '__iter__') and not isinstance(v, string_types)
+    return not isinstance(v, string_types) and callable_attr(v, '__iter__')
@@ -12,13 +12,18 @@
 
 import re
 import abc
+import sys
+import string
 import warnings
+import functools
+import unicodedata
+import urllib.parse
 from copy import deepcopy
+from itertools import islice
 from posixpath import normpath
+from urllib.parse import quote, unquote, unquote_plus
 
 import six
-from six.moves import urllib
-from six.moves.urllib.parse import quote, unquote
 try:
     from icecream import ic
 except ImportError:  # Graceful fallback if IceCream isn't installed.
@@ -110,52 +115,144 @@ def utf8(o, default=_absent):
         return o if default is _absent else default
 
 
+def utf8str(o):
+    """
+    Returns: utf8(<o>, utf8(attemptstr(<o>))), without converting <o> to a
+    string unless <o> can't be encoded itself.
+    """
+    encoded = utf8(o, None)
+    if encoded is None:
+        encoded = utf8(attemptstr(o))
+    return encoded
+
+
 def non_string_iterable(o):
-    return callable_attr(o, '__iter__') and not isinstance(o, string_types)
+    return not isinstance(o, string_types) and callable_attr(o, '__iter__')
+
+
+# Default maximum number of entries in each of furl's LRU caches. See
+# cache_configure().
+DEFAULT_CACHE_SIZE = 1024
 
 
 # TODO(grun): Support IDNA2008 via the third party idna module. See
 # https://github.com/gruns/furl/issues/73#issuecomment-226549755.
 def idna_encode(o):
+    """
+    Results for strings are cached, as the same hosts are often encoded
+    again and again. See cache_configure().
+    """
+    if isinstance(o, str):
+        return _cached_idna_encode(o)
     if callable_attr(o, 'encode'):
-        return str(o.encode('idna').decode('utf8'))
+        return _idna_encode(o)
     return o
 
 
+def _idna_encode(o):
+    return str(o.encode('idna').decode('utf8'))
+
+
 def idna_decode(o):
-    if callable_attr(utf8(o), 'decode'):
-        return utf8(o).decode('idna')
+    """
+    Results for strings and bytes are cached, as the same hosts are often
+    decoded again and again. See cache_configure().
+    """
+    if isinstance(o, (str, bytes)):
+        return _cached_idna_decode(o)
+    return _idna_decode(o)
+
+
+def _idna_decode(o):
+    encoded = utf8(o)
+    if callable_attr(encoded, 'decode'):
+        return encoded.decode('idna')
     return o
 
 
+_cached_idna_encode = functools.lru_cache(
+    maxsize=DEFAULT_CACHE_SIZE)(_idna_encode)
+_cached_idna_decode = functools.lru_cache(
+    maxsize=DEFAULT_CACHE_SIZE)(_idna_decode)
+
+
 def is_valid_port(port):
+    # Range check integer ports directly instead of round tripping them
+    # through str() and int(). type() is used instead of isinstance() to
+    # exclude bools, like True, whose string forms aren't valid ports.
+    if type(port) is int:
+        return 0 < port <= 65535
+
+    # Only accept ASCII digits. str.isdigit() also accepts characters like
+    # '²', which int() rejects, and '٣', which int() reads as 3.
     port = str(port)
-    if not port.isdigit() or not 0 < int(port) <= 65535:
-        return False
-    return True
+    return (port != '' and not port.lstrip(string.digits) and
+            0 < int(port) <= 65535)
 
 
 def static_vars(**kwargs):
     def decorator(func):
-        for key, value in six.iteritems(kwargs):
+        for key, value in kwargs.items():
             setattr(func, key, value)
         return func
     return decorator
 
 
+def create_quote_table(safe_bytes):
+    """
+    Returns: A str.translate() table that percent encodes every byte not
+    in <safe_bytes>. Bytes are translated as latin-1 decoded characters,
+    so
+
+      s.encode('utf8').decode('latin-1').translate(table)
+
+    equals quote(s.encode('utf8'), safe) for the same safe characters.
+    """
+    return {
+        byte: '%%%02X' % byte for byte in range(256)
+        if byte not in safe_bytes}
+
+
+# Query.encode() asks for the same few quote functions on every call.
+@functools.lru_cache(maxsize=None)
 def create_quote_fn(safe_charset, quote_plus):
+    safe_chars = frozenset(safe_charset)
+
+    # Characters quote() never quotes, as bytes to delete with translate().
+    # Bytes made up only of these and <safe> come back from quote()
+    # unchanged, so the common case of already safe keys and values can
+    # skip quote()'s per-byte work with one C-level scan.
+    always_safe = QUOTE_ALWAYS_SAFE
+    unquoted_bytes = {
+        True: (always_safe + safe_charset).encode('ascii'),
+        '': always_safe.encode('ascii'),
+    }
+    # And the two common <dont_quote>s' quote() as one translate() pass.
+    quote_tables = {
+        dont_quote: create_quote_table(deletes)
+        for dont_quote, deletes in unquoted_bytes.items()}
+
     def quote_fn(s, dont_quote):
         if dont_quote is True:
             safe = safe_charset
-        elif dont_quote is False:
-            safe = ''
+        elif dont_quote is False or dont_quote == '':
+            safe = dont_quote = ''
         else:  # <dont_quote> is expected to be a string.
-            safe = dont_quote
-
-        # Prune duplicates and characters not in <safe_charset>.
-        safe = ''.join(set(safe) & set(safe_charset))  # E.g. '?^#?' -> '?'.
-
-        quoted = quote(s, safe)
+            # Prune duplicates and characters not in <safe_charset>. E.g.
+            # '?^#?' -> '?'.
+            safe = ''.join(safe_chars.intersection(dont_quote))
+
+        deletes = unquoted_bytes.get(dont_quote)
+        if deletes is None:
+            deletes = (always_safe + safe).encode('ascii')
+        if not isinstance(s, bytes):
+            quoted = quote(s, safe)
+        elif not s.translate(None, deletes):
+            quoted = s.decode('ascii')
+        elif dont_quote in quote_tables:
+            quoted = s.decode('latin-1').translate(quote_tables[dont_quote])
+        else:
+            quoted = quote(s, safe)
         if quote_plus:
             quoted = quoted.replace('%20', '+')
 
@@ -204,67 +301,155 @@ def create_quote_fn(safe_charset, quote_plus):
 PERCENT_REGEX = r'\%[a-fA-F\d][a-fA-F\d]'
 INVALID_HOST_CHARS = '!@#$%^&\'\"*()+=:;/'
 
+# ASCII characters matched by the regex '\w'.
+ASCII_WORD_CHARS = string.ascii_letters + string.digits + '_'
+
+# Characters quote() never quotes. '~' joined them in Python 3.7, so it's
+# only included if this Python's quote() leaves it alone.
+QUOTE_ALWAYS_SAFE = ASCII_WORD_CHARS + '.-'
+if quote('~') == '~':
+    QUOTE_ALWAYS_SAFE += '~'
+
+
+# A '%' that doesn't start a percent encoded '%XX' triplet.
+INVALID_PERCENT_REGEX = re.compile(r'%(?![a-fA-F\d][a-fA-F\d])')
+
+
+def is_valid_encoded(s, safe_bytes, regex):
+    """
+    Returns: True if <s> matches <regex>, False otherwise. Strings made up
+    only of the ASCII characters in <safe_bytes>, which always match
+    <regex>, and '%XX' triplets are checked with a bytes.translate() pass
+    and a search for stray '%'s instead of stepping through the regex
+    character by character.
+    """
+    unsafe = s.encode('utf8', 'surrogatepass').translate(None, safe_bytes)
+    if not unsafe:
+        return True
+    if not unsafe.strip(b'%'):
+        return INVALID_PERCENT_REGEX.search(s) is None
+    return regex.match(s) is not None
+
+
+@static_vars(
+    safe_bytes=(ASCII_WORD_CHARS + '-.~:@!$&\'()*+,;=').encode('ascii'),
+    regex=re.compile(r'^(?:[\w%s]|%s)*$' % (
+        re.escape('-.~:@!$&\'()*+,;='), PERCENT_REGEX)))
+def _is_valid_encoded_path_segment(segment):
+    fn = _is_valid_encoded_path_segment
+    return is_valid_encoded(segment, fn.safe_bytes, fn.regex)
+
+
+_cached_is_valid_encoded_path_segment = functools.lru_cache(
+    maxsize=DEFAULT_CACHE_SIZE)(_is_valid_encoded_path_segment)
+
 
-@static_vars(regex=re.compile(
-    r'^([\w%s]|(%s))*$' % (re.escape('-.~:@!$&\'()*+,;='), PERCENT_REGEX)))
 def is_valid_encoded_path_segment(segment):
-    return is_valid_encoded_path_segment.regex.match(segment) is not None
+    """
+    Results for strings are cached, as the same segments, like 'api' or
+    'v1', are often validated again and again. See cache_configure().
+    """
+    if isinstance(segment, str):
+        return _cached_is_valid_encoded_path_segment(segment)
+    return _is_valid_encoded_path_segment(segment)
 
 
-@static_vars(regex=re.compile(
-    r'^([\w%s]|(%s))*$' % (re.escape('-.~:@!$&\'()*+,;/?'), PERCENT_REGEX)))
+@static_vars(
+    safe_bytes=(ASCII_WORD_CHARS + '-.~:@!$&\'()*+,;/?').encode('ascii'),
+    regex=re.compile(r'^(?:[\w%s]|%s)*$' % (
+        re.escape('-.~:@!$&\'()*+,;/?'), PERCENT_REGEX)))
 def is_valid_encoded_query_key(key):
-    return is_valid_encoded_query_key.regex.match(key) is not None
+    fn = is_valid_encoded_query_key
+    return is_valid_encoded(key, fn.safe_bytes, fn.regex)
 
 
-@static_vars(regex=re.compile(
-    r'^([\w%s]|(%s))*$' % (re.escape('-.~:@!$&\'()*+,;/?='), PERCENT_REGEX)))
+@static_vars(
+    safe_bytes=(ASCII_WORD_CHARS + '-.~:@!$&\'()*+,;/?=').encode('ascii'),
+    regex=re.compile(r'^(?:[\w%s]|%s)*$' % (
+        re.escape('-.~:@!$&\'()*+,;/?='), PERCENT_REGEX)))
 def is_valid_encoded_query_value(value):
-    return is_valid_encoded_query_value.regex.match(value) is not None
+    fn = is_valid_encoded_query_value
+    return is_valid_encoded(value, fn.safe_bytes, fn.regex)
 
 
-@static_vars(regex=re.compile(r'[a-zA-Z][a-zA-Z\-\.\+]*'))
+# Only a scheme's first character, which must be an ASCII letter, is
+# checked. Later characters, like the '_' in 'a_b', aren't.
+@static_vars(first_chars=frozenset(string.ascii_letters))
 def is_valid_scheme(scheme):
-    return is_valid_scheme.regex.match(scheme) is not None
+    return scheme[:1] in is_valid_scheme.first_chars
 
 
 @static_vars(regex=re.compile('[%s]' % re.escape(INVALID_HOST_CHARS)))
 def is_valid_host(hostname):
-    toks = hostname.split('.')
-    if toks[-1] == '':  # Trailing '.' in a fully qualified domain name.
-        toks.pop()
+    if is_valid_host.regex.search(hostname) is not None:
+        return False
+
+    if hostname.endswith('.'):  # Trailing '.' in a fully qualified domain.
+        if hostname == '.':
+            return False
+        hostname = hostname[:-1]
+
+    # Empty labels, like adjacent periods, aren't allowed.
+    return hostname == '' or (
+        hostname[0] != '.' and hostname[-1] != '.' and '..' not in hostname)
+
+
+@static_vars(
+    netloc_regex=re.compile(r'[^/?#]*'),
+    non_ascii_regex=re.compile(r'[^\x00-\x7f]'))
+def is_valid_netloc_delimiters(netloc):
+    """
+    Check <netloc> like urllib.parse.urlsplit('http://%s/' % netloc)
+    would. Netlocs without square brackets, the common case, are checked
+    without splitting an entire URL: non-ASCII characters can't NFKC
+    normalize into netloc delimiters. Netlocs with brackets, like IPv6
+    address literals, are passed to urlsplit() itself, so hosts are only
+    accepted if load() can parse them back on this Python version.
+
+    Returns: True if <netloc> is well delimited, False otherwise.
+    """
+    if not netloc:
+        return True
 
-    for tok in toks:
-        if is_valid_host.regex.search(tok) is not None:
+    fn = is_valid_netloc_delimiters
+    head = fn.netloc_regex.match(netloc).group()
+
+    if '[' in head or ']' in head:
+        try:
+            urllib.parse.urlsplit('http://%s/' % netloc)
+        except ValueError:
+            return False
+        return True
+
+    if fn.non_ascii_regex.search(head):
+        chars = head
+        for c in '@:#?':
+            chars = chars.replace(c, '')
+        normalized = unicodedata.normalize('NFKC', chars)
+        if normalized != chars and any(c in normalized for c in '/?#@:'):
             return False
 
-    return '' not in toks  # Adjacent periods aren't allowed.
+    return True
+
+
+# A valid scheme, per is_valid_scheme(), followed by the first ':' in a URL.
+# Colons after the first '/', '?', or '#' belong to other URL components,
+# like the query of 'a?query:', and aren't matched.
+SCHEME_REGEX = re.compile(r'([a-zA-Z][^:/?#]*):')
 
 
 def get_scheme(url):
     if url.startswith(':'):
         return ''
 
-    # Avoid incorrect scheme extraction with url.find(':') when other URL
-    # components, like the path, query, fragment, etc, may have a colon in
-    # them. For example, the URL 'a?query:', whose query has a ':' in it.
-    no_fragment = url.split('#', 1)[0]
-    no_query = no_fragment.split('?', 1)[0]
-    no_path_or_netloc = no_query.split('/', 1)[0]
-    scheme = url[:max(0, no_path_or_netloc.find(':'))] or None
-
-    if scheme is not None and not is_valid_scheme(scheme):
-        return None
-
-    return scheme
+    match = SCHEME_REGEX.match(url)
+    return None if match is None else match.group(1)
 
 
 def strip_scheme(url):
-    scheme = get_scheme(url) or ''
-    url = url[len(scheme):]
-    if url.startswith(':'):
-        url = url[1:]
-    return url
+    # A scheme found by get_scheme() is always followed by a ':'.
+    scheme = get_scheme(url)
+    return url if scheme is None else url[len(scheme) + 1:]
 
 
 def set_scheme(url, scheme):
@@ -290,7 +475,28 @@ def urlsplit(url):
       query, fragment, username, password, hostname, port). See
         http://docs.python.org/library/urlparse.html#urlparse.urlsplit
       for more details on urlsplit().
+
+    Results are cached, as the same URL strings are often split again and
+    again. See cache_configure().
     """
+    return _cached_urlsplit(url)
+
+
+# Splits a URL that's had its scheme removed into its '//'-prefixed netloc,
+# path, query, and fragment, like urllib.parse.urlsplit() does. This is the
+# RFC 3986, appendix B regex, minus its scheme group.
+SCHEMELESS_URL_REGEX = re.compile(
+    r'(//[^/?#]*)?([^?#]*)(?:\?([^#]*))?(?:#(.*))?', re.DOTALL)
+
+# Characters that urllib.parse.urlsplit() strips, removes, validates, or
+# normalizes: leading C0 control characters and spaces, tabs and newlines,
+# IPv6 brackets, and non-ASCII characters. URLs without any of these are
+# split with SCHEMELESS_URL_REGEX instead.
+URLSPLIT_SPECIAL_CHARS_REGEX = re.compile(
+    r'^[\x00-\x20]|[\t\n\r\[\]\x80-\U0010ffff]')
+
+
+def _urlsplit(url):
     original_scheme = get_scheme(url)
 
     # urlsplit() parses URLs differently depending on whether or not the URL's
@@ -306,14 +512,28 @@ def urlsplit(url):
     # in all of the aforementioned uses_* lists, and afterwards revert to the
     # original scheme (which may or may not be in some, or all, of the the
     # uses_* lists).
+    #
+    # A non-None scheme is always followed by a ':', so the scheme can be
+    # swapped by slicing instead of re-parsing the URL with set_scheme() and
+    # strip_scheme().
     if original_scheme is not None:
-        url = set_scheme(url, 'http')
+        after_scheme = url[len(original_scheme) + 1:]
+        if original_scheme != 'http':
+            url = 'http:' + after_scheme
+    else:
+        after_scheme = url
+
+    if URLSPLIT_SPECIAL_CHARS_REGEX.search(url) is None:
+        netloc, path, query, fragment = SCHEMELESS_URL_REGEX.match(
+            after_scheme).groups()
+        netloc = None if netloc is None else netloc[2:]
+        return urllib.parse.SplitResult(
+            original_scheme, netloc, path, query or '', fragment or '')
 
     scheme, netloc, path, query, fragment = urllib.parse.urlsplit(url)
 
     # Detect and preserve the '//' before the netloc, if present. E.g. preserve
     # URLs like 'http:', 'http://', and '///sup' correctly.
-    after_scheme = strip_scheme(url)
     if after_scheme.startswith('//'):
         netloc = netloc or ''
     else:
@@ -324,6 +544,53 @@ def urlsplit(url):
     return urllib.parse.SplitResult(scheme, netloc, path, query, fragment)
 
 
+_cached_urlsplit = functools.lru_cache(maxsize=DEFAULT_CACHE_SIZE)(_urlsplit)
+
+
+def cache_configure(urlsplit_size=DEFAULT_CACHE_SIZE,
+                    idna_encode_size=DEFAULT_CACHE_SIZE,
+                    idna_decode_size=DEFAULT_CACHE_SIZE,
+                    path_segment_size=DEFAULT_CACHE_SIZE):
+    """
+    Resize, and clear, furl's LRU caches. For each cache, None means
+    unbounded and 0 disables the cache.
+
+    Parameters:
+      urlsplit_size: Maximum number of URL strings whose urlsplit()
+        results are cached.
+      idna_encode_size: Maximum number of hosts whose idna_encode()
+        results are cached.
+      idna_decode_size: Maximum number of hosts whose idna_decode()
+        results are cached.
+      path_segment_size: Maximum number of path segments whose
+        is_valid_encoded_path_segment() results are cached.
+    """
+    global _cached_urlsplit, _cached_idna_encode, _cached_idna_decode
+    global _cached_is_valid_encoded_path_segment
+    _cached_urlsplit = functools.lru_cache(maxsize=urlsplit_size)(_urlsplit)
+    _cached_idna_encode = functools.lru_cache(
+        maxsize=idna_encode_size)(_idna_encode)
+    _cached_idna_decode = functools.lru_cache(
+        maxsize=idna_decode_size)(_idna_decode)
+    _cached_is_valid_encoded_path_segment = functools.lru_cache(
+        maxsize=path_segment_size)(_is_valid_encoded_path_segment)
+
+
+def cache_info():
+    """
+    Returns: Dictionary of the statistics of furl's LRU caches, like
+    {'urlsplit': CacheInfo(hits=3, misses=8, maxsize=1024, currsize=8),
+     'idna_encode': CacheInfo(...), 'idna_decode': CacheInfo(...),
+     'path_segment': CacheInfo(...)}.
+    """
+    return {
+        'urlsplit': _cached_urlsplit.cache_info(),
+        'idna_encode': _cached_idna_encode.cache_info(),
+        'idna_decode': _cached_idna_decode.cache_info(),
+        'path_segment': _cached_is_valid_encoded_path_segment.cache_info(),
+    }
+
+
 def urljoin(base, url):
     """
     Parameters:
@@ -332,8 +599,21 @@ def urljoin(base, url):
 
     Returns: The resultant URL from joining <base> and <url>.
     """
-    base_scheme = get_scheme(base) if has_netloc(base) else None
-    url_scheme = get_scheme(url) if has_netloc(url) else None
+    # Like get_scheme(base) if has_netloc(base) else None, but without
+    # finding each scheme twice. Likewise for <url> and <joined> below.
+    base_scheme = get_scheme(base)
+    if base_scheme is not None and not base.startswith(base_scheme + '://'):
+        base_scheme = None
+    url_scheme = get_scheme(url)
+    if url_scheme is not None and not url.startswith(url_scheme + '://'):
+        url_scheme = None
+
+    # urllib.parse.urljoin() returns an absolute <url> unchanged when its
+    # scheme differs from the base URL's, which is 'http' below.
+    if (base_scheme is not None and url_scheme and
+            url_scheme.lower() != 'http' and
+            not url_scheme.strip(urllib.parse.scheme_chars)):
+        return url
 
     if base_scheme is not None:
         # For consistent URL joining, switch the base URL's scheme to
@@ -347,15 +627,20 @@ def urljoin(base, url):
         #
         #   >>> urllib.parse.urljoin('asdf://google.com/', 'hi')
         #   'hi'
-        root = set_scheme(base, 'http')
+        root = 'http' + base[len(base_scheme):]
     else:
         root = base
 
     joined = urllib.parse.urljoin(root, url)
 
     new_scheme = url_scheme if url_scheme is not None else base_scheme
-    if new_scheme is not None and has_netloc(joined):
-        joined = set_scheme(joined, new_scheme)
+    if new_scheme is not None:
+        joined_scheme = get_scheme(joined)
+        if joined_scheme is None:
+            if joined.startswith('//'):
+                joined = new_scheme + ':' + joined
+        elif joined.startswith(joined_scheme + '://'):
+            joined = new_scheme + joined[len(joined_scheme):]
 
     return joined
 
@@ -380,19 +665,21 @@ def join_path_segments(*args):
     """
     finals = []
 
+    # Empty segment lists and [''] are skipped, so below <segments> always
+    # has at least one segment and, if segments[0] == '', at least two.
     for segments in args:
         if not segments or segments == ['']:
             continue
         elif not finals:
             finals.extend(segments)
+        # Example #1: ['a',''] + ['b'] == ['a','b']
+        # Example #2: ['a',''] + ['','b'] == ['a','','b']
+        elif finals[-1] == '':
+            finals[-1:] = segments
+        # Example: ['a'] + ['','b'] == ['a','b']
+        elif segments[0] == '':
+            finals.extend(islice(segments, 1, None))
         else:
-            # Example #1: ['a',''] + ['b'] == ['a','b']
-            # Example #2: ['a',''] + ['','b'] == ['a','','b']
-            if finals[-1] == '' and (segments[0] != '' or len(segments) > 1):
-                finals.pop(-1)
-            # Example: ['a'] + ['','b'] == ['a','b']
-            elif finals[-1] != '' and segments[0] == '' and len(segments) > 1:
-                segments = segments[1:]
             finals.extend(segments)
 
     return finals
@@ -414,29 +701,31 @@ def remove_path_segments(segments, remove):
     segments from <remove> were removed from <segments>, <segments> is
     returned unmodified.
     """
-    # [''] means a '/', which is properly represented by ['', ''].
+    # [''] means a '/', which is properly represented by ['', '']. Replace
+    # rather than append to <segments> and <remove>, which are the caller's
+    # lists.
     if segments == ['']:
-        segments.append('')
+        segments = ['', '']
     if remove == ['']:
-        remove.append('')
+        remove = ['', '']
 
-    ret = None
     if remove == segments:
-        ret = []
-    elif len(remove) > len(segments):
-        ret = segments
-    else:
-        toremove = list(remove)
-
-        if len(remove) > 1 and remove[0] == '':
-            toremove.pop(0)
-
-        if toremove and toremove == segments[-1 * len(toremove):]:
-            ret = segments[:len(segments) - len(toremove)]
-            if remove[0] != '' and ret:
-                ret.append('')
-        else:
-            ret = segments
+        return []
+    if len(remove) > len(segments):
+        return segments
+
+    # Compare the suffix of <segments> against <remove> directly instead
+    # of copying <remove> and popping its leading '' off the front.
+    toremove = remove
+    if len(remove) > 1 and remove[0] == '':
+        toremove = remove[1:]
+    nremaining = len(segments) - len(toremove)
+    if not toremove or segments[nremaining:] != toremove:
+        return segments
+
+    ret = segments[:nremaining]
+    if remove[0] != '' and ret:
+        ret.append('')
 
     return ret
 
@@ -488,7 +777,19 @@ class Path(object):
     #                       / "*" / "+" / "," / ";" / "="
     SAFE_SEGMENT_CHARS = ":@-._~!$&'()*+,;="
 
+    # Segments, and paths, made up only of these never need quoting or
+    # unquoting.
+    _SAFE_SEGMENT_BYTES = (ASCII_WORD_CHARS + SAFE_SEGMENT_CHARS).encode()
+    _SAFE_PATH_BYTES = _SAFE_SEGMENT_BYTES + b'/'
+    _SEGMENT_QUOTE_TABLE = create_quote_table(_SAFE_SEGMENT_BYTES)
+    _PATH_QUOTE_TABLE = create_quote_table(_SAFE_PATH_BYTES)
+
+    # A Path is created for every furl and Fragment.
+    __slots__ = ('segments', 'strict', '_isabsolute', '_force_absolute',
+                 '_str_cache', '__weakref__')
+
     def __init__(self, path='', force_absolute=lambda _: False, strict=False):
+        self._str_cache = (None, None)  # (segments, path). See __str__().
         self.segments = []
 
         self.strict = strict
@@ -506,6 +807,8 @@ class Path(object):
         """
         if not path:
             segments = []
+        elif type(path) is str:  # String interface, the common case.
+            segments = self._segments_from_path(path)
         elif quacks_like_a_path_with_segments(path):  # Path interface.
             segments = path.segments
         elif is_iterable_but_not_string(path):  # List interface.
@@ -518,7 +821,9 @@ class Path(object):
         else:
             self._isabsolute = (segments and segments[0] == '')
 
-        if self.isabsolute and len(segments) > 1 and segments[0] == '':
+        # Same as self.isabsolute here, without another _force_absolute()
+        # call; a forced absolute path without segments has none to pop.
+        if self._isabsolute and len(segments) > 1 and segments[0] == '':
             segments.pop(0)
 
         self.segments = segments
@@ -575,13 +880,41 @@ class Path(object):
 
         Returns: <self>.
         """
-        if str(self):
+        if not str(self):
+            return self
+
+        if not all(type(segment) is str for segment in self.segments):
             normalized = normpath(str(self)) + ('/' * self.isdir)
             if normalized.startswith('//'):  # http://bugs.python.org/636648
                 normalized = '/' + normalized.lstrip('/')
-            self.load(normalized)
+            return self.load(normalized)
 
-        return self
+        # Resolve '.' and '..' like normpath() does on str(self), but on
+        # the segments themselves. A segment is '', '.' or '..' exactly
+        # when its encoded form is, so nothing needs to be requoted.
+        segments = self.segments
+        if self.isabsolute:
+            segments = [''] + segments
+        isabsolute = bool(segments) and segments[0] == ''
+
+        normalized = []
+        for segment in segments:
+            if segment in ('', '.'):
+                continue
+            if (segment != '..' or (not isabsolute and not normalized) or
+                    (normalized and normalized[-1] == '..')):
+                normalized.append(segment)
+            elif normalized:
+                normalized.pop()
+
+        if isabsolute:
+            normalized = [''] + (normalized or [''])
+        elif not normalized:
+            normalized = ['.']
+        if self.isdir and normalized != ['', '']:
+            normalized.append('')
+
+        return self.load(normalized)
 
     def asdict(self):
         return {
@@ -617,8 +950,7 @@ class Path(object):
         otherwise. If True, the last segment is '', representing the
         trailing '/' of the path.
         """
-        return (self.segments == [] or
-                (self.segments and self.segments[-1] == ''))
+        return not self.segments or self.segments[-1] == ''
 
     @property
     def isfile(self):
@@ -629,11 +961,63 @@ class Path(object):
         """
         return not self.isdir
 
+    def __deepcopy__(self, memo):
+        path = self._clone(memo)
+        # If this Path belongs to a furl or Fragment, _force_absolute is
+        # a bound method of its owner and deepcopy() copies the owner too.
+        # An owner that's already being copied is taken from <memo>.
+        path._force_absolute = deepcopy(self._force_absolute, memo)
+        return path
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        state.update(
+            (attr, getattr(self, attr)) for attr in Path.__slots__[:-1])
+        return state
+
+    def __setstate__(self, state):
+        self._str_cache = (None, None)  # Absent from older pickles.
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def _clone(self, memo=None):
+        """
+        Returns: A copy of this Path that shares its _force_absolute.
+        Attributes of subclasses without __slots__ are deepcopy()d with
+        <memo>.
+        """
+        path = self.__class__.__new__(self.__class__)
+        if memo is None:
+            memo = {}
+        memo[id(self)] = path
+        path.segments = list(self.segments)
+        path.strict = self.strict
+        path._isabsolute = self._isabsolute
+        path._force_absolute = self._force_absolute
+        path._str_cache = self._str_cache
+        if hasattr(self, '__dict__'):  # Subclasses without __slots__.
+            for attr, value in self.__dict__.items():
+                path.__dict__[attr] = deepcopy(value, memo)
+        return path
+
     def __truediv__(self, path):
-        copy = deepcopy(self)
+        # A Path owned by a furl or Fragment has a bound _force_absolute
+        # method, and copying it means deepcopy()ing its owner, too.
+        if hasattr(self._force_absolute, '__self__'):
+            copy = deepcopy(self)
+        else:
+            copy = self._clone()
         return copy.add(path)
 
     def __eq__(self, other):
+        # Paths with the same string segments and absoluteness serialize
+        # identically, so skip serializing them.
+        if isinstance(other, Path):
+            segments = self.segments
+            if (segments == other.segments and
+                    bool(self.isabsolute) == bool(other.isabsolute) and
+                    all(type(segment) is str for segment in segments)):
+                return True
         return str(self) == str(other)
 
     def __ne__(self, other):
@@ -644,13 +1028,28 @@ class Path(object):
     __nonzero__ = __bool__
 
     def __str__(self):
-        segments = list(self.segments)
-        if self.isabsolute:
+        # <segments> is public and can be changed in place, so the last
+        # path string built is reused only if the segments and isabsolute
+        # it was built from still match.
+        isabsolute = self.isabsolute
+        key = (tuple(self.segments), isabsolute)
+        if key == self._str_cache[0]:
+            return self._str_cache[1]
+
+        segments = list(key[0])
+        if isabsolute:
             if not segments:
                 segments = ['', '']
             else:
                 segments.insert(0, '')
-        return self._path_from_segments(segments)
+        path = self._path_from_segments(segments)
+
+        # Only cache paths built from strings. Other values, like 1 and
+        # True, can compare equal yet have different string forms.
+        if all(type(segment) is str for segment in key[0]):
+            self._str_cache = (key, path)
+
+        return path
 
     def __repr__(self):
         return "%s('%s')" % (self.__class__.__name__, str(self))
@@ -666,6 +1065,11 @@ class Path(object):
         refactor the list vs string interface testing to this common
         method.
         """
+        unsafe = path.encode('utf8', 'surrogatepass').translate(
+            None, self._SAFE_PATH_BYTES)
+        if not unsafe:
+            return path.split('/')
+
         segments = []
         for segment in path.split('/'):
             if not is_valid_encoded_path_segment(segment):
@@ -675,17 +1079,11 @@ class Path(object):
                          "Proceeding, but did you mean '%s'?" %
                          (path, self._path_from_segments(segments)))
                     warnings.warn(s, UserWarning)
-            segments.append(utf8(segment))
+            segments.append(segment)
         del segment
 
-        # In Python 3, utf8() returns Bytes objects that must be decoded into
-        # strings before they can be passed to unquote(). In Python 2, utf8()
-        # returns strings that can be passed directly to urllib.unquote().
-        segments = [
-            segment.decode('utf8')
-            if isinstance(segment, bytes) and not isinstance(segment, str)
-            else segment for segment in segments]
-
+        # Segments are already strings, and unquote() returns segments
+        # without a '%' as is.
         return [unquote(segment) for segment in segments]
 
     def _path_from_segments(self, segments):
@@ -695,7 +1093,23 @@ class Path(object):
 
         Returns: A path string with quoted path segments.
         """
+        # Without a '/' inside any segment, the joined path can be checked,
+        # and quoted, in one translate() pass with '/' left as is.
+        if all(type(segment) is str for segment in segments):
+            path = '/'.join(segments)
+            if path.count('/') < len(segments):
+                unsafe = path.encode('utf8', 'surrogatepass')
+                if not unsafe.translate(None, self._SAFE_PATH_BYTES):
+                    return path
+                return path.encode('utf8').decode('latin-1').translate(
+                    self._PATH_QUOTE_TABLE)
+
+        # Otherwise, quote str segments with one translate() pass each,
+        # rather than quote()'s byte by byte loop.
+        table = self._SEGMENT_QUOTE_TABLE
         segments = [
+            segment.encode('utf8').decode('latin-1').translate(table)
+            if type(segment) is str else
             quote(utf8(attemptstr(segment)), self.SAFE_SEGMENT_CHARS)
             for segment in segments]
         return '/'.join(segments)
@@ -777,7 +1191,15 @@ class URLPathCompositionInterface(PathCompositionInterface):
         PathCompositionInterface.__init__(self, strict=strict)
 
     def _force_absolute(self, path):
-        return bool(path) and self.netloc
+        # Same as bool(path) and bool(self.netloc), without building the
+        # netloc string. It's asked for on every isabsolute and str(path).
+        if not path:
+            return False
+        if (self.username is not None or self.password is not None or
+                self._host):
+            return True
+        port = self.port
+        return bool(port) and port != DEFAULT_PORTS.get(self._scheme)
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -901,7 +1323,11 @@ class Query(object):
     SAFE_KEY_CHARS = "/?:@-._~!$'()*+,;"
     SAFE_VALUE_CHARS = SAFE_KEY_CHARS + '='
 
+    # A Query is created for every furl and Fragment.
+    __slots__ = ('strict', '_params', '_encode_cache', '__weakref__')
+
     def __init__(self, query='', strict=False):
+        self._encode_cache = (None, None)  # (params, query). See encode().
         self.strict = strict
 
         self._params = omdict1D()
@@ -1007,18 +1433,26 @@ class Query(object):
         if delimeter is not _absent:
             delimiter = delimeter
 
+        # <params> is public and can be changed in place, so the last query
+        # string encoded is reused only if the params and arguments it was
+        # encoded from still match.
+        items = self.params.allitems()
+        cachekey = (items, delimiter, quote_plus, dont_quote)
+        if cachekey == self._encode_cache[0]:
+            return self._encode_cache[1]
+
         quote_key = create_quote_fn(self.SAFE_KEY_CHARS, quote_plus)
         quote_value = create_quote_fn(self.SAFE_VALUE_CHARS, quote_plus)
 
         pairs = []
-        for key, value in self.params.iterallitems():
-            utf8key = utf8(key, utf8(attemptstr(key)))
+        for key, value in items:
+            utf8key = utf8str(key)
             quoted_key = quote_key(utf8key, dont_quote)
 
             if value is None:  # Example: http://sprop.su/?key.
                 pair = quoted_key
             else:  # Example: http://sprop.su/?key=value.
-                utf8value = utf8(value, utf8(attemptstr(value)))
+                utf8value = utf8str(value)
                 quoted_value = quote_value(utf8value, dont_quote)
 
                 if not quoted_key:  # Unquote '=' to allow queries like '?==='.
@@ -1030,6 +1464,12 @@ class Query(object):
 
         query = delimiter.join(pairs)
 
+        # Only cache queries built from strings. Other values, like 1 and
+        # True, can compare equal yet have different string forms.
+        if all(type(key) is str and (type(value) is str or value is None)
+               for key, value in items):
+            self._encode_cache = (cachekey, query)
+
         return query
 
     def asdict(self):
@@ -1038,7 +1478,36 @@ class Query(object):
             'params': self.params.allitems(),
             }
 
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))
+        state.update(strict=self.strict, _params=self._params)
+        return state
+
+    def __setstate__(self, state):
+        self._encode_cache = (None, None)  # Absent from older pickles.
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
+    def __deepcopy__(self, memo):
+        query = self.__class__.__new__(self.__class__)
+        memo[id(self)] = query
+        query.strict = self.strict
+        query._encode_cache = self._encode_cache
+        if hasattr(self, '__dict__'):  # Subclasses without __slots__.
+            for attr, value in self.__dict__.items():
+                query.__dict__[attr] = deepcopy(value, memo)
+        query._params = omdict1D(deepcopy(self._params.allitems(), memo))
+        return query
+
     def __eq__(self, other):
+        # Queries with the same string (or None) keys and values serialize
+        # identically, so skip serializing them.
+        if isinstance(other, Query):
+            items = self.params.allitems()
+            if (items == other.params.allitems() and all(
+                    type(key) is str and (type(value) is str or value is None)
+                    for key, value in items)):
+                return True
         return str(self) == str(other)
 
     def __ne__(self, other):
@@ -1081,6 +1550,20 @@ class Query(object):
         """
         if not items:
             items = []
+        # The common exact types are dispatched on directly instead of
+        # probing for each interface below. They pick the same branch.
+        elif type(items) is str:
+            items = self._extract_items_from_querystr(items)
+        elif type(items) is dict:
+            items = list(items.items())
+        elif type(items) is omdict1D:
+            items = list(items.allitems())
+        # Callers only iterate over the returned items, so a list is used
+        # as is instead of being copied.
+        elif type(items) is list:
+            pass
+        elif type(items) is tuple:
+            items = list(items)
         # Multivalue Dictionary-like interface. e.g. {'a':1, 'a':2,
         # 'b':2}
         elif callable_attr(items, 'allitems'):
@@ -1104,27 +1587,41 @@ class Query(object):
 
     def _extract_items_from_querystr(self, querystr):
         items = []
-
         pairstrs = querystr.split('&')
-        pairs = [item.split('=', 1) for item in pairstrs]
-        pairs = [(p[0], lget(p, 1, '')) for p in pairs]  # Pad with value ''.
 
-        for pairstr, (key, value) in six.moves.zip(pairstrs, pairs):
-            valid_key = is_valid_encoded_query_key(key)
-            valid_value = is_valid_encoded_query_value(value)
-            if self.strict and (not valid_key or not valid_value):
+        # Without an encoded '&' or '=', unquoting the whole query string
+        # and splitting it afterwards yields the same keys and values as
+        # unquoting each one. '&' and '=' are ASCII, so they also split
+        # UTF-8 decoding, and its error replacement, the same way.
+        decoded = None
+        if ('%26' not in querystr and '%3D' not in querystr and
+                '%3d' not in querystr):
+            decoded = unquote_plus(querystr).split('&')
+
+        # The encoding is only validated when there's a warning to raise.
+        # A value's safe characters are a key's plus '=', and '&' is safe in
+        # both, so a valid query string has only valid keys and values. One
+        # pass over it then stands in for a pass over every key and value.
+        strict = self.strict and not is_valid_encoded_query_value(querystr)
+        for i, pairstr in enumerate(pairstrs):
+            key, equals, value = pairstr.partition('=')
+            if strict and (not is_valid_encoded_query_key(key) or
+                           not is_valid_encoded_query_value(value)):
+                pairs = [item.partition('=')[::2] for item in pairstrs]
                 msg = (
                     "Incorrectly percent encoded query string received: '%s'. "
                     "Proceeding, but did you mean '%s'?" %
                     (querystr, urllib.parse.urlencode(pairs)))
                 warnings.warn(msg, UserWarning)
 
-            key_decoded = unquote(key.replace('+', ' '))
+            if decoded is not None:
+                key_decoded, _, value_decoded = decoded[i].partition('=')
+            else:
+                key_decoded = unquote_plus(key)
+                value_decoded = unquote_plus(value)
             # Empty value without a '=', e.g. '?sup'.
-            if key == pairstr:
+            if not equals:
                 value_decoded = None
-            else:
-                value_decoded = unquote(value.replace('+', ' '))
 
             items.append((key_decoded, value_decoded))
 
@@ -1191,6 +1688,15 @@ class Fragment(FragmentPathCompositionInterface, QueryCompositionInterface):
         separating '?' is desired.
     """
 
+    # The composition interface that handles setting each of these
+    # attributes in __setattr__(). All other attributes are set normally.
+    _SETATTR_HANDLERS = {
+        '_path': PathCompositionInterface.__setattr__,
+        'path': PathCompositionInterface.__setattr__,
+        'args': QueryCompositionInterface.__setattr__,
+        'query': QueryCompositionInterface.__setattr__,
+    }
+
     def __init__(self, fragment='', strict=False):
         FragmentPathCompositionInterface.__init__(self, strict=strict)
         QueryCompositionInterface.__init__(self, strict=strict)
@@ -1200,35 +1706,27 @@ class Fragment(FragmentPathCompositionInterface, QueryCompositionInterface):
         self.load(fragment)
 
     def load(self, fragment):
-        self.path.load('')
-        self.query.load('')
-
         if fragment is None:
             fragment = ''
 
-        toks = fragment.split('?', 1)
-        if len(toks) == 0:
-            self._path.load('')
-            self._query.load('')
-        elif len(toks) == 1:
+        # Find the path and query with one scan for '?' and one for '='.
+        # The part that isn't loaded is reset to empty.
+        path, query = fragment, ''
+        qmark = fragment.find('?')
+        if qmark < 0:
             # Does this fragment look like a path or a query? Default to
             # path.
             if '=' in fragment:  # Query example: '#woofs=dogs'.
-                self._query.load(fragment)
-            else:  # Path example: '#supinthisthread'.
-                self._path.load(fragment)
-        else:
-            # Does toks[1] actually look like a query? Like 'a=a' or
-            # 'a=' or '=a'?
-            if '=' in toks[1]:
-                self._path.load(toks[0])
-                self._query.load(toks[1])
-            # If toks[1] doesn't look like a query, the user probably
-            # provided a fragment string like 'a?b?' that was intended
-            # to be adopted as-is, not a two part fragment with path 'a'
-            # and query 'b?'.
-            else:
-                self._path.load(fragment)
+                path, query = '', fragment
+        # Does the part after '?' actually look like a query? Like 'a=a'
+        # or 'a=' or '=a'? If not, the user probably provided a fragment
+        # string like 'a?b?' that was intended to be adopted as-is, not a
+        # two part fragment with path 'a' and query 'b?'.
+        elif fragment.find('=', qmark + 1) >= 0:
+            path, query = fragment[:qmark], fragment[qmark + 1:]
+
+        self._path.load(path)
+        self._query.load(query)
 
     def add(self, path=_absent, args=_absent):
         if path is not _absent:
@@ -1266,6 +1764,17 @@ class Fragment(FragmentPathCompositionInterface, QueryCompositionInterface):
             'query': self.query.asdict(),
             }
 
+    def __deepcopy__(self, memo):
+        fragment = self.__class__.__new__(self.__class__)
+        memo[id(self)] = fragment
+        for attr, value in self.__dict__.items():
+            if attr not in ('_path', '_query'):
+                fragment.__dict__[attr] = deepcopy(value, memo)
+        fragment.__dict__.update(  # Bypass __setattr__()'s load()ing.
+            _path=deepcopy(self._path, memo),
+            _query=deepcopy(self._query, memo))
+        return fragment
+
     def __eq__(self, other):
         return str(self) == str(other)
 
@@ -1273,9 +1782,11 @@ class Fragment(FragmentPathCompositionInterface, QueryCompositionInterface):
         return not self == other
 
     def __setattr__(self, attr, value):
-        if (not PathCompositionInterface.__setattr__(self, attr, value) and
-                not QueryCompositionInterface.__setattr__(self, attr, value)):
+        handler = self._SETATTR_HANDLERS.get(attr)
+        if handler is None:
             object.__setattr__(self, attr, value)
+        else:
+            handler(self, attr, value)
 
     def __bool__(self):
         return bool(self.path) or bool(self.query)
@@ -1364,6 +1875,20 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
       fragment: Fragment object from FragmentCompositionInterface.
     """
 
+    # The composition interface that handles setting each of these
+    # attributes in __setattr__(). All other attributes are set normally.
+    _SETATTR_HANDLERS = {
+        '_path': PathCompositionInterface.__setattr__,
+        'path': PathCompositionInterface.__setattr__,
+        'args': QueryCompositionInterface.__setattr__,
+        'query': QueryCompositionInterface.__setattr__,
+        'fragment': FragmentCompositionInterface.__setattr__,
+    }
+
+    # (components, url) of the last URL built. See tostr(). Set here too, as
+    # furls pickled before this cache existed restore without it.
+    _tostr_cache = (None, None)
+
     def __init__(self, url='', args=_absent, path=_absent, fragment=_absent,
                  scheme=_absent, netloc=_absent, origin=_absent,
                  fragment_path=_absent, fragment_args=_absent,
@@ -1373,6 +1898,8 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         """
         Raises: ValueError on invalid URL or invalid URL component(s) provided.
         """
+        self._tostr_cache = (None, None)  # (components, url). See tostr().
+
         URLPathCompositionInterface.__init__(self, strict=strict)
         QueryCompositionInterface.__init__(self, strict=strict)
         FragmentCompositionInterface.__init__(self, strict=strict)
@@ -1390,8 +1917,8 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         """
         Parse and load a URL.
 
-        Raises: ValueError on invalid URL, like a malformed IPv6 address
-        or invalid port.
+        Raises: ValueError on invalid URL, like a malformed IPv6 address,
+        invalid port, or host that can't be IDNA encoded.
         """
         self.username = self.password = None
         self._host = self._port = self._scheme = None
@@ -1413,6 +1940,19 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         self.query.load(tokens.query)
         self.fragment.load(tokens.fragment)
 
+        # Raise UnicodeErrors, which are ValueErrors, on URLs that can't be
+        # serialized here rather than in str(f) later: a query, username,
+        # password, or fragment that can't be UTF-8 encoded, like one with
+        # a lone surrogate, or a host that can't be IDNA encoded, like one
+        # with a label over 63 characters. Paths are already encoded as
+        # they're loaded. The host's encoding is cached for str(f).
+        tokens.query.encode('utf8')
+        userinfo, at, _ = (tokens.netloc or '').partition('@')
+        if at:
+            userinfo.encode('utf8')
+        idna_encode(self._host)
+        tokens.fragment.encode('utf8')
+
         return self
 
     @property
@@ -1421,9 +1961,16 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
 
     @scheme.setter
     def scheme(self, scheme):
-        if callable_attr(scheme, 'lower'):
-            scheme = scheme.lower()
-        self._scheme = scheme
+        # Known lowercase schemes, the common case, needn't be lowered.
+        if type(scheme) is not str or scheme not in DEFAULT_PORTS:
+            if callable_attr(scheme, 'lower'):
+                scheme = scheme.lower()
+            if scheme not in DEFAULT_PORTS:
+                self._scheme = scheme
+                return
+        # Intern known schemes so the DEFAULT_PORTS lookups made on every
+        # port, netloc, and origin access hit the dict's identity fast path.
+        self._scheme = sys.intern(scheme)
 
     @property
     def host(self):
@@ -1434,8 +1981,9 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         """
         Raises: ValueError on invalid host or malformed IPv6 address.
         """
-        # Invalid IPv6 literal.
-        urllib.parse.urlsplit('http://%s/' % host)  # Raises ValueError.
+        # Malformed IPv6 literal.
+        if not is_valid_netloc_delimiters(host):
+            raise ValueError("Invalid host '%s'." % host)
 
         # Invalid host string.
         resembles_ipv6_literal = (
@@ -1449,15 +1997,17 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
                 "have adjacent periods.")
             raise ValueError(errmsg % (host, INVALID_HOST_CHARS))
 
-        if callable_attr(host, 'lower'):
+        # str hosts, the common case, needn't be probed for their methods.
+        if type(host) is str or callable_attr(host, 'lower'):
             host = host.lower()
-        if callable_attr(host, 'startswith') and host.startswith('xn--'):
+        if ((type(host) is str or callable_attr(host, 'startswith')) and
+                host.startswith('xn--')):
             host = idna_decode(host)
         self._host = host
 
     @property
     def port(self):
-        return self._port or DEFAULT_PORTS.get(self.scheme)
+        return self._port or DEFAULT_PORTS.get(self._scheme)
 
     @port.setter
     def port(self, port):
@@ -1469,7 +2019,7 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         Raises: ValueError on invalid port.
         """
         if port is None:
-            self._port = DEFAULT_PORTS.get(self.scheme)
+            self._port = DEFAULT_PORTS.get(self._scheme)
         elif is_valid_port(port):
             self._port = int(str(port))
         else:
@@ -1484,8 +2034,9 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
             userpass += '@'
 
         netloc = idna_encode(self.host)
-        if self.port and self.port != DEFAULT_PORTS.get(self.scheme):
-            netloc = (netloc or '') + (':' + str(self.port))
+        port = self.port
+        if port and port != DEFAULT_PORTS.get(self._scheme):
+            netloc = (netloc or '') + (':' + str(port))
 
         if userpass or netloc:
             netloc = (userpass or '') + (netloc or '')
@@ -1500,33 +2051,33 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
             'user:pass@google.com:99'.
         Raises: ValueError on invalid port or malformed IPv6 address.
         """
-        # Raises ValueError on malformed IPv6 addresses.
-        urllib.parse.urlsplit('http://%s/' % netloc)
+        # Malformed IPv6 literal.
+        if not is_valid_netloc_delimiters(netloc):
+            raise ValueError("Invalid netloc '%s'." % netloc)
 
         username = password = host = port = None
 
         if netloc and '@' in netloc:
-            userpass, netloc = netloc.split('@', 1)
+            userpass, _, netloc = netloc.partition('@')
             if ':' in userpass:
-                username, password = userpass.split(':', 1)
+                username, _, password = userpass.partition(':')
             else:
                 username = userpass
 
-        if netloc and ':' in netloc:
-            # IPv6 address literal.
-            if ']' in netloc:
-                colonpos, bracketpos = netloc.rfind(':'), netloc.rfind(']')
-                if colonpos > bracketpos and colonpos != bracketpos + 1:
-                    raise ValueError("Invalid netloc '%s'." % netloc)
-                elif colonpos > bracketpos and colonpos == bracketpos + 1:
-                    host, port = netloc.rsplit(':', 1)
-                else:
-                    host = netloc
-            else:
-                host, port = netloc.rsplit(':', 1)
-                host = host
-        else:
+        # The port follows the last ':', unless that ':' is inside an IPv6
+        # address literal, like '[::1]'. A port after an IPv6 literal must
+        # directly follow its closing ']'.
+        colonpos = netloc.rfind(':') if netloc else -1
+        if colonpos < 0:
             host = netloc
+        else:
+            bracketpos = netloc.rfind(']')
+            if colonpos < bracketpos:
+                host = netloc
+            elif bracketpos >= 0 and colonpos != bracketpos + 1:
+                raise ValueError("Invalid netloc '%s'." % netloc)
+            else:
+                host, port = netloc[:colonpos], netloc[colonpos + 1:]
 
         # Avoid side effects by assigning self.port before self.host so
         # that if an exception is raised when assigning self.port,
@@ -1538,12 +2089,13 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
 
     @property
     def origin(self):
-        port = ''
-        scheme = self.scheme or ''
-        host = idna_encode(self.host) or ''
-        if self.port and self.port != DEFAULT_PORTS.get(self.scheme):
-            port = ':%s' % self.port
-        origin = '%s://%s%s' % (scheme, host, port)
+        scheme, port = self._scheme, self.port
+        host = idna_encode(self._host) or ''
+        if port and port != DEFAULT_PORTS.get(scheme):
+            port = ':%s' % port
+        else:
+            port = ''
+        origin = '%s://%s%s' % (scheme or '', host, port)
 
         return origin
 
@@ -1620,6 +2172,36 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
 
         return self
 
+    def _warn_set_overlaps(
+            self, scheme, origin, netloc, host, port, args, query,
+            query_params, fragment, fragment_path, fragment_args,
+            fragment_separator):
+        if scheme is not _absent and origin is not _absent:
+            s = ('Possible parameter overlap: <scheme> and <origin>. See '
+                 'furl.set() documentation for more details.')
+            warnings.warn(s, UserWarning)
+        if ((netloc is not _absent) + (origin is not _absent) +
+                (host is not _absent or port is not _absent)) >= 2:
+            s = ('Possible parameter overlap: <origin>, <netloc> and/or '
+                 '(<host> and/or <port>) provided. See furl.set() '
+                 'documentation for more details.')
+            warnings.warn(s, UserWarning)
+        if ((args is not _absent) + (query is not _absent) +
+                (query_params is not _absent)) >= 2:
+            s = ('Possible parameter overlap: <query>, <args>, and/or '
+                 '<query_params> provided. See furl.set() documentation for '
+                 'more details.')
+            warnings.warn(s, UserWarning)
+        if fragment is not _absent and (
+                fragment_path is not _absent or
+                fragment_args is not _absent or
+                fragment_separator is not _absent):
+            s = ('Possible parameter overlap: <fragment> and '
+                 '(<fragment_path>and/or <fragment_args>) or <fragment> '
+                 'and <fragment_separator> provided. See furl.set() '
+                 'documentation for more details.')
+            warnings.warn(s, UserWarning)
+
     def set(self, args=_absent, path=_absent, fragment=_absent, query=_absent,
             scheme=_absent, username=_absent, password=_absent, host=_absent,
             port=_absent, netloc=_absent, origin=_absent, query_params=_absent,
@@ -1682,35 +2264,33 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
             <fragment_args>, and/or <fragment_separator>) are provided.
         Returns: <self>.
         """
-        def present(v):
-            return v is not _absent
-
-        if present(scheme) and present(origin):
-            s = ('Possible parameter overlap: <scheme> and <origin>. See '
-                 'furl.set() documentation for more details.')
-            warnings.warn(s, UserWarning)
-        provided = [
-            present(netloc), present(origin), present(host) or present(port)]
-        if sum(provided) >= 2:
-            s = ('Possible parameter overlap: <origin>, <netloc> and/or '
-                 '(<host> and/or <port>) provided. See furl.set() '
-                 'documentation for more details.')
-            warnings.warn(s, UserWarning)
-        if sum(present(p) for p in [args, query, query_params]) >= 2:
-            s = ('Possible parameter overlap: <query>, <args>, and/or '
-                 '<query_params> provided. See furl.set() documentation for '
-                 'more details.')
-            warnings.warn(s, UserWarning)
-        provided = [fragment_path, fragment_args, fragment_separator]
-        if present(fragment) and any(present(p) for p in provided):
-            s = ('Possible parameter overlap: <fragment> and '
-                 '(<fragment_path>and/or <fragment_args>) or <fragment> '
-                 'and <fragment_separator> provided. See furl.set() '
-                 'documentation for more details.')
-            warnings.warn(s, UserWarning)
-
-        # Guard against side effects on exception.
-        original_url = self.url
+        # furl(url), the most common construction, calls set() without any
+        # parameters, and there's then nothing to set or roll back. Most
+        # other calls provide a single parameter, which can't overlap with
+        # anything. Only check for overlaps when there's more than one.
+        provided = (
+            args, path, fragment, query, scheme, username, password, host,
+            port, netloc, origin, query_params, fragment_path, fragment_args,
+            fragment_separator)
+        # Counted by identity, as tuple.count() would call each argument's
+        # __eq__(), like Path.__eq__(), which serializes the path.
+        nprovided = sum(value is not _absent for value in provided)
+        if not nprovided:
+            return self
+        if nprovided > 1:
+            self._warn_set_overlaps(
+                scheme, origin, netloc, host, port, args, query,
+                query_params, fragment, fragment_path, fragment_args,
+                fragment_separator)
+
+        # Guard against side effects on exception. Assigning <username>,
+        # <password>, and <fragment_separator> can't raise, so when only
+        # they're provided there's nothing to roll back.
+        cheap = (username, password, fragment_separator)
+        if nprovided == sum(value is not _absent for value in cheap):
+            original_url = None
+        else:
+            original_url = self.url
         try:
             if username is not _absent:
                 self.username = username
@@ -1732,12 +2312,12 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
 
             if path is not _absent:
                 self.path.load(path)
-            if query is not _absent:
-                self.query.load(query)
-            if args is not _absent:
-                self.query.load(args)
-            if query_params is not _absent:
-                self.query.load(query_params)
+            # <query>, <args>, and <query_params> each replace the whole
+            # query, so only the last one provided needs to be loaded.
+            for value in (query_params, args, query):
+                if value is not _absent:
+                    self.query.load(value)
+                    break
             if fragment is not _absent:
                 self.fragment.load(fragment)
             if fragment_path is not _absent:
@@ -1747,7 +2327,8 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
             if fragment_separator is not _absent:
                 self.fragment.separator = fragment_separator
         except Exception:
-            self.load(original_url)
+            if original_url is not None:
+                self.load(original_url)
             raise
 
         return self
@@ -1821,27 +2402,59 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
 
     def tostr(self, query_delimiter='&', query_quote_plus=True,
               query_dont_quote=''):
-        encoded_query = self.query.encode(
+        scheme, host = self._scheme, self._host
+        port = self._port or DEFAULT_PORTS.get(scheme)
+        username, password = self.username, self.password
+
+        # Fast path for the common 'scheme://host/path' shape: no username,
+        # password, non-default port, query, or fragment. The path of a URL
+        # with a host is always absolute, so str(self.path) is either empty
+        # or starts with '/'.
+        if (scheme and host and username is None and password is None and
+                (not port or port == DEFAULT_PORTS.get(scheme)) and
+                not self.query and not self.fragment):
+            return '%s://%s%s' % (scheme, idna_encode(host), str(self.path))
+
+        path, fragment = str(self.path), str(self.fragment)
+        query = self.query.encode(
             query_delimiter, query_quote_plus, query_dont_quote)
-        url = urllib.parse.urlunsplit((
-            self.scheme or '',  # Must be text type in Python 3.
-            self.netloc,
-            str(self.path),
-            encoded_query,
-            str(self.fragment),
-        ))
+
+        # Reuse the last URL built if none of its components have changed
+        # since. This skips the netloc's quoting and IDNA encoding.
+        key = (scheme, username, password, host, port, path, query, fragment)
+        if key == self._tostr_cache[0]:
+            return self._tostr_cache[1]
+
+        # Assemble the URL like urllib.parse.urlunsplit() does, minus its
+        # argument coercion and repeated string concatenation.
+        netloc = self.netloc
+        parts = [scheme + ':' if scheme else '']
+        if netloc or (scheme and scheme in urllib.parse.uses_netloc and
+                      path[:2] != '//'):
+            parts.extend(('//', netloc or ''))
+            if path and path[:1] != '/':
+                parts.append('/')
+        parts.append(path)
+        if query:
+            parts.extend(('?', query))
+        if fragment:
+            parts.extend(('#', fragment))
+        url = ''.join(parts)
 
         # Differentiate between '' and None values for scheme and netloc.
-        if self.scheme == '':
+        if scheme == '':
             url = ':' + url
 
-        if self.netloc == '':
-            if self.scheme is None:
+        if netloc == '':
+            if scheme is None:
                 url = '//' + url
             elif strip_scheme(url) == '':
                 url = url + '//'
 
-        return str(url)
+        url = str(url)
+        self._tostr_cache = (key, url)
+
+        return url
 
     def join(self, *urls):
         for url in urls:
@@ -1852,7 +2465,7 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         return self
 
     def copy(self):
-        return self.__class__(self)
+        return deepcopy(self)
 
     def asdict(self):
         return {
@@ -1873,6 +2486,18 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
     def __truediv__(self, path):
         return self.copy().add(path=path)
 
+    def __deepcopy__(self, memo):
+        f = self.__class__.__new__(self.__class__)
+        memo[id(self)] = f
+        for attr, value in self.__dict__.items():
+            if attr not in ('_path', '_query', '_fragment'):
+                f.__dict__[attr] = deepcopy(value, memo)
+        f.__dict__.update(  # Bypass __setattr__()'s load()ing.
+            _path=deepcopy(self._path, memo),
+            _query=deepcopy(self._query, memo),
+            _fragment=deepcopy(self._fragment, memo))
+        return f
+
     def __eq__(self, other):
         try:
             return self.url == other.url
@@ -1883,10 +2508,11 @@ class furl(URLPathCompositionInterface, QueryCompositionInterface,
         return not self == other
 
     def __setattr__(self, attr, value):
-        if (not PathCompositionInterface.__setattr__(self, attr, value) and
-           not QueryCompositionInterface.__setattr__(self, attr, value) and
-           not FragmentCompositionInterface.__setattr__(self, attr, value)):
+        handler = self._SETATTR_HANDLERS.get(attr)
+        if handler is None:
             object.__setattr__(self, attr, value)
+        else:
+            handler(self, attr, value)
 
     def __unicode__(self):
         return self.tostr()
@@ -76,8 +76,7 @@ class omdict1D(omdict):
         """
         for key, values in items:
             # <values> is not a list or an empty list.
-            like_list_not_str = is_iterable_but_not_string(values)
-            if not like_list_not_str or (like_list_not_str and not values):
+            if not is_iterable_but_not_string(values) or not values:
                 values = [values]
 
             for value in values: